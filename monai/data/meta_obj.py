@@ -204,6 +204,9 @@ class MetaObj:
     def push_applied_operation(self, t: Any) -> None:
         self._applied_operations.append(t)
 
+    def extend_applied_operations(self, t: Iterable) -> None:
+        self._applied_operations.extend(t)
+
     def pop_applied_operation(self) -> Any:
         return self._applied_operations.pop()
 
@@ -25,7 +25,7 @@ from monai.data.meta_obj import MetaObj, get_track_meta
 from monai.data.utils import affine_to_spacing, decollate_batch, list_data_collate, remove_extra_metadata
 from monai.utils import look_up_option
 from monai.utils.enums import LazyAttr, MetaKeys, PostFix, SpaceKeys
-from monai.utils.type_conversion import convert_data_type, convert_to_dst_type, convert_to_numpy, convert_to_tensor
+from monai.utils.type_conversion import convert_data_type, convert_to_dst_type, convert_to_tensor
 
 __all__ = ["MetaTensor"]
 
@@ -481,11 +481,10 @@ class MetaTensor(MetaObj, torch.Tensor):
         Get the currently expected spatial shape as if all the pending operations are executed.
         For tensors that have more than 3 spatial dimensions, only the shapes of the top 3 dimensions will be returned.
         """
-        res = None
-        if self.pending_operations:
-            res = self.pending_operations[-1].get(LazyAttr.SHAPE, None)
-        # default to spatial shape (assuming channel-first input)
-        return tuple(convert_to_numpy(self.shape, wrap_sequence=True).tolist()[1:]) if res is None else res
+        pending = self.pending_operations
+        res = pending[-1].get(LazyAttr.SHAPE, None) if pending else None
+        # default to spatial shape (assuming channel-first input), torch.Size items are already python ints
+        return tuple(self.shape[1:]) if res is None else res
 
     def peek_pending_affine(self):
         res = self.affine
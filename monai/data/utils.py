@@ -901,11 +901,10 @@ def compute_shape_offset(
     corners_out = corners_out[:-1] / corners_out[-1]
     out_shape = np.round(corners_out.ptp(axis=1)) if scale_extent else np.round(corners_out.ptp(axis=1) + 1.0)
     offset = None
-    for i in range(corners.shape[1]):
-        min_corner = np.min(all_dist - all_dist[:, i : i + 1], 1)
-        if np.allclose(min_corner, 0.0, rtol=AFFINE_TOL):
-            offset = corners[:-1, i]  # corner is the smallest, shift the corner to origin
-            break
+    # check all the corners at once: a corner is the smallest if it attains the minimum along every axis
+    min_corners = np.isclose(np.min(all_dist, 1, keepdims=True) - all_dist, 0.0, rtol=AFFINE_TOL).all(0)
+    if min_corners.any():
+        offset = corners[:-1, int(np.argmax(min_corners))]  # corner is the smallest, shift the corner to origin
     if offset is None:  # otherwise make output image center aligned with the input image center
         offset = in_affine_[:-1, :-1] @ (shape / 2.0) + in_affine_[:-1, -1] - out_affine_[:-1, :-1] @ (out_shape / 2.0)
     if scale_extent:
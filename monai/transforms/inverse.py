@@ -37,6 +37,8 @@ from monai.utils import (
 
 __all__ = ["TraceableTransform", "InvertibleTransform"]
 
+_TRANSFORM_INFO_KEYS = (TraceKeys.CLASS_NAME, TraceKeys.ID, TraceKeys.TRACING, TraceKeys.DO_TRANSFORM)
+
 
 class TraceableTransform(Transform):
     """
@@ -86,18 +88,13 @@ class TraceableTransform(Transform):
     @staticmethod
     def transform_info_keys():
         """The keys to store necessary info of an applied transform."""
-        return (TraceKeys.CLASS_NAME, TraceKeys.ID, TraceKeys.TRACING, TraceKeys.DO_TRANSFORM)
+        return _TRANSFORM_INFO_KEYS
 
     def get_transform_info(self) -> dict:
         """
         Return a dictionary with the relevant information pertaining to an applied transform.
         """
-        vals = (
-            self.__class__.__name__,
-            id(self),
-            self.tracing,
-            self._do_transform if hasattr(self, "_do_transform") else True,
-        )
+        vals = (self.__class__.__name__, id(self), self.tracing, getattr(self, "_do_transform", True))
         return dict(zip(self.transform_info_keys(), vals))
 
     def push_transform(self, data, *args, **kwargs):
@@ -18,10 +18,9 @@ import torch
 from monai.apps.utils import get_logger
 from monai.config import NdarrayOrTensor
 from monai.data.meta_tensor import MetaTensor
-from monai.data.utils import to_affine_nd
 from monai.transforms.lazy.utils import (
     affine_from_pending,
-    combine_transforms,
+    combine_affines,
     is_compatible_apply_kwargs,
     kwargs_from_pending,
     resample,
@@ -255,10 +254,8 @@ def apply_pending(data: torch.Tensor | MetaTensor, pending: list | None = None,
     if not pending:
         return data, []
 
-    cumulative_xform = affine_from_pending(pending[0])
-    if cumulative_xform.shape[0] == 3:
-        cumulative_xform = to_affine_nd(3, cumulative_xform)
-
+    # the affines are collected and only combined when a resampling is required
+    xforms = [affine_from_pending(pending[0])]
     cur_kwargs = kwargs_from_pending(pending[0])
     override_kwargs: dict[str, Any] = {}
     if "mode" in overrides:
@@ -279,17 +276,12 @@ def apply_pending(data: torch.Tensor | MetaTensor, pending: list | None = None,
             # carry out an intermediate resample here due to incompatibility between arguments
             _cur_kwargs = cur_kwargs.copy()
             _cur_kwargs.update(override_kwargs)
-            data = resample(data.to(device), cumulative_xform, _cur_kwargs)
-
-        next_matrix = affine_from_pending(p)
-        if next_matrix.shape[0] == 3:
-            next_matrix = to_affine_nd(3, next_matrix)
+            data = resample(data.to(device), combine_affines(xforms), _cur_kwargs)
 
-        cumulative_xform = combine_transforms(cumulative_xform, next_matrix)
+        xforms.append(affine_from_pending(p))
         cur_kwargs.update(new_kwargs)
     cur_kwargs.update(override_kwargs)
-    data = resample(data.to(device), cumulative_xform, cur_kwargs)
+    data = resample(data.to(device), combine_affines(xforms), cur_kwargs)
     if isinstance(data, MetaTensor):
-        for p in pending:
-            data.push_applied_operation(p)
+        data.extend_applied_operations(pending)
     return data, pending
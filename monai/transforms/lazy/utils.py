@@ -12,17 +12,20 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Sequence
 
 import numpy as np
 import torch
 
 import monai
 from monai.config import NdarrayOrTensor
-from monai.data.utils import AFFINE_TOL
+from monai.data.utils import AFFINE_TOL, to_affine_nd
 from monai.transforms.utils_pytorch_numpy_unification import allclose
 from monai.utils import LazyAttr, convert_to_numpy, convert_to_tensor, look_up_option
 
-__all__ = ["resample", "combine_transforms"]
+__all__ = ["resample", "combine_transforms", "combine_affines"]
+
+_AFFINE_SHAPES = frozenset({(3, 3), (4, 4)})  # 2D and 3D homogeneous affine matrices
 
 
 class Affine:
@@ -40,9 +43,7 @@ class Affine:
             return True
         if isinstance(data, DisplacementField):
             return False
-        if not hasattr(data, "shape") or len(data.shape) < 2:
-            return False
-        return data.shape[-1] in (3, 4) and data.shape[-1] == data.shape[-2]
+        return hasattr(data, "shape") and tuple(data.shape[-2:]) in _AFFINE_SHAPES
 
 
 class DisplacementField:
@@ -80,6 +81,19 @@ def combine_transforms(left: torch.Tensor, right: torch.Tensor) -> torch.Tensor:
     raise NotImplementedError
 
 
+def combine_affines(matrices: Sequence[NdarrayOrTensor]) -> torch.Tensor:
+    """
+    Given affine transforms [A, B, C, ...] to be applied to x, return the combined transform (ABC...).
+    2D affines are promoted to 3D, and all the matrices are multiplied in a single chained matmul.
+    Unlike `combine_transforms`, the output is always a float64 tensor.
+    """
+    xforms = [
+        convert_to_tensor(to_affine_nd(3, m) if len(m) == 3 else m, dtype=torch.float64, wrap_sequence=True)
+        for m in matrices
+    ]
+    return xforms[0] if len(xforms) == 1 else torch.linalg.multi_dot(xforms)
+
+
 def affine_from_pending(pending_item):
     """Extract the affine matrix from a pending transform item."""
     if isinstance(pending_item, (torch.Tensor, np.ndarray)):
@@ -129,15 +143,17 @@ def requires_interp(matrix, atol=AFFINE_TOL):
 
     ndim = len(matrix) - 1
     ox, oy = [], [0]
-    for x, r in enumerate(matrix[:ndim, :ndim]):
+    # plain scalar comparisons on the small 2D/3D matrix, same as `np.isclose(c, +/-1, atol)`, `np.isclose(c, 0, atol)`
+    tol_one = atol + 1e-5  # default `rtol` of `np.isclose` times |+/-1|
+    for x, r in enumerate(matrix[:ndim, :ndim].tolist()):
         for y, c in enumerate(r):
-            if np.isclose(c, -1, atol=atol) or np.isclose(c, 1, atol=atol):
+            if abs(abs(c) - 1.0) <= tol_one:
                 y_channel = y + 1  # the returned axis index starting with channel dim
                 if x in ox or y_channel in oy:
                     return None
                 ox.append(x)
                 oy.append(y_channel)
-            elif not np.isclose(c, 0.0, atol=atol):
+            elif not abs(c) <= atol:  # also rejects nan
                 return None
     return oy
 
@@ -28,7 +28,7 @@ from monai.config.type_definitions import NdarrayOrTensor
 from monai.data.meta_obj import get_track_meta, set_track_meta
 from monai.data.meta_tensor import MetaTensor
 from monai.data.utils import AFFINE_TOL, affine_to_spacing, compute_shape_offset, iter_patch, to_affine_nd, zoom_affine
-from monai.networks.layers import AffineTransform, GaussianFilter, grid_pull
+from monai.networks.layers import AffineTransform, gaussian_1d, grid_pull, separable_filtering
 from monai.networks.utils import meshgrid_ij
 from monai.transforms.croppad.array import CenterSpatialCrop, ResizeWithPadOrCrop
 from monai.transforms.inverse import InvertibleTransform
@@ -1774,14 +1774,12 @@ class AffineGrid(LazyTransform):
             return None, affine
 
         affine = convert_to_tensor(affine, device=grid_.device, dtype=grid_.dtype, track_meta=False)  # type: ignore
+        xform = affine
         if self.align_corners:
-            sc = create_scale(
-                spatial_dims, [max(d, 2) / (max(d, 2) - 1) for d in grid_.shape[1:]], device=_device, backend=_b
-            )
-            sc = convert_to_dst_type(sc, affine)[0]
-            grid_ = ((affine @ sc) @ grid_.view((grid_.shape[0], -1))).view([-1] + list(grid_.shape[1:]))
-        else:
-            grid_ = (affine @ grid_.view((grid_.shape[0], -1))).view([-1] + list(grid_.shape[1:]))
+            # `affine @ diag(sc)` is a column-wise scaling, no need to build the scaling matrix
+            sc = [max(d, 2) / (max(d, 2) - 1) for d in grid_.shape[1:]] + [1.0]
+            xform = affine * torch.as_tensor(sc, dtype=affine.dtype, device=affine.device)
+        grid_ = (xform @ grid_.view((grid_.shape[0], -1))).view([-1] + list(grid_.shape[1:]))
         return grid_, affine
 
 
@@ -2896,13 +2894,16 @@ class Rand3DElastic(RandomizableTransform):
             self.randomize(grid_size=sp_size)
 
         _device = img.device if isinstance(img, torch.Tensor) else self.device
-        grid = create_grid(spatial_size=sp_size, device=_device, backend="torch")
+        # float32 is the precision used by `rand_affine_grid`, no need to build and update a float64 grid
+        grid = create_grid(spatial_size=sp_size, device=_device, backend="torch", dtype=torch.float32)
         if self._do_transform:
             if self.rand_offset is None:
                 raise RuntimeError("rand_offset is not initialized.")
-            gaussian = GaussianFilter(3, self.sigma, 3.0).to(device=_device)
+            # smooth the offsets with a functional separable Gaussian, no GaussianFilter module per call
+            kernel = gaussian_1d(torch.as_tensor(self.sigma, dtype=torch.float, device=_device), truncated=3.0)
             offset = torch.as_tensor(self.rand_offset, device=_device).unsqueeze(0)
-            grid[:3] += gaussian(offset)[0] * self.magnitude
+            # scaled in-place update, without allocating a temporary for `offset * magnitude`
+            grid[:3].add_(separable_filtering(offset, [kernel] * 3)[0], alpha=float(self.magnitude))
             grid = self.rand_affine_grid(grid=grid)
         out: torch.Tensor = self.resampler(
             img,
@@ -64,6 +64,17 @@ def _maybe_new_metatensor(img, dtype=None, device=None):
     )
 
 
+def _as_tensor_or_metatensor(img):
+    """
+    convert img into a metatensor if track_meta is True otherwise a torch tensor.
+    Tracked contiguous metatensors are returned as is, the other inputs go through `convert_to_tensor`.
+    """
+    track_meta = get_track_meta()
+    if track_meta and isinstance(img, MetaTensor) and img.is_contiguous():
+        return img
+    return convert_to_tensor(img, track_meta=track_meta)
+
+
 def spatial_resample(
     img, dst_affine, spatial_size, mode, padding_mode, align_corners, dtype_pt, lazy, transform_info
 ) -> torch.Tensor:
@@ -96,7 +107,7 @@ def spatial_resample(
     """
     original_spatial_shape = img.peek_pending_shape() if isinstance(img, MetaTensor) else img.shape[1:]
     src_affine: torch.Tensor = img.peek_pending_affine() if isinstance(img, MetaTensor) else torch.eye(4)
-    img = convert_to_tensor(data=img, track_meta=get_track_meta())
+    img = _as_tensor_or_metatensor(img)
     # ensure spatial rank is <= 3
     spatial_rank = min(len(img.shape) - 1, src_affine.shape[0] - 1, 3)
     if (not isinstance(spatial_size, int) or spatial_size != -1) and spatial_size is not None:
@@ -199,7 +210,7 @@ def orientation(img, original_affine, spatial_ornt, lazy, transform_info) -> tor
     """
     spatial_shape = img.peek_pending_shape() if isinstance(img, MetaTensor) else img.shape[1:]
     xform = nib.orientations.inv_ornt_aff(spatial_ornt, spatial_shape)
-    img = convert_to_tensor(img, track_meta=get_track_meta())
+    img = _as_tensor_or_metatensor(img)
 
     spatial_ornt[:, 0] += 1  # skip channel dim
     spatial_ornt = np.concatenate([np.array([[0, 1]]), spatial_ornt])
@@ -246,7 +257,7 @@ def flip(img, sp_axes, lazy, transform_info):
         transform_info: a dictionary with the relevant information pertaining to an applied transform.
     """
     sp_size = img.peek_pending_shape() if isinstance(img, MetaTensor) else img.shape[1:]
-    sp_size = convert_to_numpy(sp_size, wrap_sequence=True).tolist()
+    sp_size = [int(i) for i in sp_size]  # flipping doesn't change the spatial shape
     extra_info = {"axes": sp_axes}  # track the spatial axes
     axes = monai.transforms.utils.map_spatial_axes(img.ndim, sp_axes)  # use the axes with channel dim
     rank = img.peek_pending_rank() if isinstance(img, MetaTensor) else torch.tensor(3.0, dtype=torch.double)
@@ -292,7 +303,7 @@ def resize(
         lazy: a flag that indicates whether the operation should be performed lazily or not
         transform_info: a dictionary with the relevant information pertaining to an applied transform.
     """
-    img = convert_to_tensor(img, track_meta=get_track_meta())
+    img = _as_tensor_or_metatensor(img)
     orig_size = img.peek_pending_shape() if isinstance(img, MetaTensor) else img.shape[1:]
     extra_info = {
         "mode": mode,
@@ -371,9 +382,9 @@ def rotate(img, angle, output_shape, mode, padding_mode, align_corners, dtype, l
     _angle = ensure_tuple_rep(angle, 1 if input_ndim == 2 else 3)
     transform = create_rotate(input_ndim, _angle)
     if output_shape is None:
-        corners = np.asarray(np.meshgrid(*[(0, dim) for dim in im_shape], indexing="ij")).reshape((len(im_shape), -1))
-        corners = transform[:-1, :-1] @ corners  # type: ignore
-        output_shape = np.asarray(corners.ptp(axis=1) + 0.5, dtype=int)
+        # extent of the rotated bounding box along axis i is sum_j |R_ij| * dim_j, no need to transform the corners
+        extent = np.abs(transform[:-1, :-1]) @ np.asarray(im_shape, dtype=float)  # type: ignore
+        output_shape = np.asarray(extent + 0.5, dtype=int)
     else:
         output_shape = np.asarray(output_shape, dtype=int)
     shift = create_translate(input_ndim, ((np.array(im_shape) - 1) / 2).tolist())
@@ -438,6 +449,7 @@ def zoom(img, scale_factor, keep_size, mode, padding_mode, align_corners, dtype,
     """
     im_shape = img.peek_pending_shape() if isinstance(img, MetaTensor) else img.shape[1:]
     output_size = [int(math.floor(float(i) * z)) for i, z in zip(im_shape, scale_factor)]
+    zoomed_size = output_size  # the spatial size before any `keep_size` padding/cropping
     xform = scale_affine(im_shape, output_size)
     extra_info = {
         "mode": mode,
@@ -472,14 +484,25 @@ def zoom(img, scale_factor, keep_size, mode, padding_mode, align_corners, dtype,
     if lazy:
         return out.copy_meta_from(meta_info) if isinstance(out, MetaTensor) else meta_info
     img_t = out.to(dtype)
+    zoomed: NdarrayOrTensor
     _, _m, _, _ = resolves_modes(mode, torch_interpolate_spatial_nd=len(img_t.shape) - 1)
-    zoomed: NdarrayOrTensor = torch.nn.functional.interpolate(
-        recompute_scale_factor=True,
-        input=img_t.unsqueeze(0),
-        scale_factor=list(scale_factor),
-        mode=_m,
-        align_corners=align_corners,
-    ).squeeze(0)
+    if list(img_t.shape[1:]) == zoomed_size:
+        # the scale factor is recomputed from the sizes, interpolating onto the same grid is a no-op,
+        # a copy keeps the output independent of the input as `interpolate` would
+        if align_corners is not None and _m in ("nearest", "area", "nearest-exact"):
+            raise ValueError(
+                "align_corners option can only be set with the interpolating modes: "
+                "linear | bilinear | bicubic | trilinear"
+            )
+        zoomed = img_t.clone()
+    else:
+        zoomed = torch.nn.functional.interpolate(
+            recompute_scale_factor=True,
+            input=img_t.unsqueeze(0),
+            scale_factor=list(scale_factor),
+            mode=_m,
+            align_corners=align_corners,
+        ).squeeze(0)
     out, *_ = convert_to_dst_type(zoomed, dst=out, dtype=torch.float32)
     if isinstance(out, MetaTensor):
         out = out.copy_meta_from(meta_info)
@@ -516,18 +539,21 @@ def rotate90(img, axes, k, lazy, transform_info):
         sp_shape[a_0], sp_shape[a_1] = ori_shape[a_1], ori_shape[a_0]
     rank = img.peek_pending_rank() if isinstance(img, MetaTensor) else torch.tensor(3.0, dtype=torch.double)
     r, sp_r = int(rank), len(ori_shape)
-    xform = to_affine_nd(r, create_translate(sp_r, [-float(d - 1) / 2 for d in sp_shape]))
-    s = -1.0 if int(axes[0]) - int(axes[1]) in (-1, 2) else 1.0
-    if sp_r == 2:
-        rot90 = to_affine_nd(r, create_rotate(sp_r, [s * np.pi / 2]))
+    if k % 4 == 0:  # full turns only, the spatial shape is unchanged and the affine is the identity
+        xform = np.eye(r + 1)
     else:
-        idx = {1, 2, 3} - set(axes)
-        angle: list[float] = [0, 0, 0]
-        angle[idx.pop() - 1] = s * np.pi / 2
-        rot90 = to_affine_nd(r, create_rotate(sp_r, angle))
-    for _ in range(k):
-        xform = rot90 @ xform
-    xform = to_affine_nd(r, create_translate(sp_r, [float(d - 1) / 2 for d in ori_shape])) @ xform
+        xform = to_affine_nd(r, create_translate(sp_r, [-float(d - 1) / 2 for d in sp_shape]))
+        s = -1.0 if int(axes[0]) - int(axes[1]) in (-1, 2) else 1.0
+        if sp_r == 2:
+            rot90 = to_affine_nd(r, create_rotate(sp_r, [s * np.pi / 2]))
+        else:
+            idx = {1, 2, 3} - set(axes)
+            angle: list[float] = [0, 0, 0]
+            angle[idx.pop() - 1] = s * np.pi / 2
+            rot90 = to_affine_nd(r, create_rotate(sp_r, angle))
+        for _ in range(k):
+            xform = rot90 @ xform
+        xform = to_affine_nd(r, create_translate(sp_r, [float(d - 1) / 2 for d in ori_shape])) @ xform
     meta_info = TraceableTransform.track_transform_meta(
         img,
         sp_size=sp_shape,
@@ -540,7 +566,8 @@ def rotate90(img, axes, k, lazy, transform_info):
     out = _maybe_new_metatensor(img)
     if lazy:
         return out.copy_meta_from(meta_info) if isinstance(out, MetaTensor) else meta_info
-    out = torch.rot90(out, k, axes)
+    # full turns: copy the input as torch.rot90 would, the output shouldn't share memory with the input
+    out = torch.rot90(out, k, axes) if k % 4 != 0 else out.clone(memory_format=torch.contiguous_format)
     return out.copy_meta_from(meta_info) if isinstance(out, MetaTensor) else out
 
 
@@ -60,6 +60,12 @@ __all__ = [
 ]
 
 
+@functools.lru_cache(None)
+def _enum_value_lut(supported: enum.EnumMeta) -> dict:
+    """a value-to-member dictionary of `supported`, computed once per enum class."""
+    return {item.value: item for item in supported}  # type: ignore
+
+
 def look_up_option(
     opt_str: Hashable,
     supported: Collection | enum.EnumMeta,
@@ -102,9 +108,11 @@ def look_up_option(
     if isinstance(opt_str, str):
         opt_str = opt_str.strip()
     if isinstance(supported, enum.EnumMeta):
-        if isinstance(opt_str, str) and opt_str in {item.value for item in supported}:  # type: ignore
-            # such as: "example" in MyEnum
-            return supported(opt_str)
+        if isinstance(opt_str, str):
+            lut = _enum_value_lut(supported)
+            if opt_str in lut:
+                # such as: "example" in MyEnum
+                return lut[opt_str]
         if isinstance(opt_str, enum.Enum) and opt_str in supported:
             # such as: MyEnum.EXAMPLE in MyEnum
             return opt_str
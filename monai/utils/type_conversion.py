@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import re
 from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -43,21 +44,25 @@ __all__ = [
 UNSUPPORTED_TYPES = {np.dtype("uint16"): np.int32, np.dtype("uint32"): np.int64, np.dtype("uint64"): np.int64}
 
 
+@lru_cache(None)
 def get_numpy_dtype_from_string(dtype: str) -> np.dtype:
     """Get a numpy dtype (e.g., `np.float32`) from its string (e.g., `"float32"`)."""
     return np.empty([], dtype=str(dtype).split(".")[-1]).dtype
 
 
+@lru_cache(None)
 def get_torch_dtype_from_string(dtype: str) -> torch.dtype:
     """Get a torch dtype (e.g., `torch.float32`) from its string (e.g., `"float32"`)."""
     return dtype_numpy_to_torch(get_numpy_dtype_from_string(dtype))
 
 
+@lru_cache(None)
 def dtype_torch_to_numpy(dtype: torch.dtype) -> np.dtype:
     """Convert a torch dtype to its numpy equivalent."""
     return torch.empty([], dtype=dtype).numpy().dtype  # type: ignore
 
 
+@lru_cache(None)
 def dtype_numpy_to_torch(dtype: np.dtype) -> torch.dtype:
     """Convert a numpy dtype to its torch equivalent."""
     return torch.from_numpy(np.empty([], dtype=dtype)).dtype
@@ -130,6 +130,33 @@ for p in TEST_NDARRAYS_ALL:
                 ),
             ]
         )
+        TESTS.append(
+            [
+                {"rotate_params": 0.5, "scale_params": (1.5, 0.5), "align_corners": True, "device": device},
+                {"spatial_size": (2, 3)},
+                np.array(
+                    [
+                        [[-0.9568047, -1.3163738, -1.675943], [1.675943, 1.3163738, 0.9568047]],
+                        [[-1.3773252, -0.7191383, -0.0609514], [0.0609514, 0.7191383, 1.3773252]],
+                        [[1.0, 1.0, 1.0], [1.0, 1.0, 1.0]],
+                    ]
+                ),
+            ]
+        )
+        TESTS.append(
+            [
+                {"translate_params": (1.0, 0.0, -1.0), "align_corners": True, "device": device},
+                {"spatial_size": (2, 1, 3)},  # a singleton dimension is scaled by 2
+                np.array(
+                    [
+                        [[[0.0, 0.0, 0.0]], [[2.0, 2.0, 2.0]]],
+                        [[[0.0, 0.0, 0.0]], [[0.0, 0.0, 0.0]]],
+                        [[[-2.5, -1.0, 0.5]], [[-2.5, -1.0, 0.5]]],
+                        [[[1.0, 1.0, 1.0]], [[1.0, 1.0, 1.0]]],
+                    ]
+                ),
+            ]
+        )
 
 _rtol = 5e-2 if is_tf32_env() else 1e-4
 
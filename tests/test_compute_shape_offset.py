@@ -0,0 +1,71 @@
+# Copyright (c) MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+import torch
+from parameterized import parameterized
+
+from monai.data.utils import compute_shape_offset
+
+_c, _s = np.cos(np.pi / 4), np.sin(np.pi / 4)
+
+TESTS = [
+    [(10, 20, 30), np.eye(4), np.diag([2.0, 2.0, 2.0, 1.0]), False, (6, 10, 16), (0.0, 0.0, 0.0)],
+    # flipped first axis, the smallest corner is not the first one
+    [(4, 6), np.diag([-1.0, 1.0, 1.0]), np.eye(3), False, (4, 6), (-3.0, 0.0)],
+    # axes permutation with a translation
+    [
+        (4, 6, 8),
+        np.array([[0.0, 1.0, 0.0, 2.0], [-1.0, 0.0, 0.0, 3.0], [0.0, 0.0, 1.0, 4.0], [0.0, 0.0, 0.0, 1.0]]),
+        np.eye(4),
+        False,
+        (6, 4, 8),
+        (2.0, 0.0, 4.0),
+    ],
+    # 45 degrees rotation
+    [
+        (4, 6),
+        np.array([[_c, -_s, 0.0], [_s, _c, 0.0], [0.0, 0.0, 1.0]]),
+        np.eye(3),
+        False,
+        (7, 7),
+        (-4.20710678, 0.03553391),
+    ],
+    [
+        (5, 7, 9),
+        np.diag([-1.0, 2.0, -3.0, 1.0]),
+        np.diag([0.5, 1.0, 1.5, 1.0]),
+        True,
+        (10, 14, 18),
+        (-0.25, -0.5, -0.75),
+    ],
+]
+
+
+class TestComputeShapeOffset(unittest.TestCase):
+    @parameterized.expand(TESTS)
+    def test_shape_offset(self, spatial_shape, in_affine, out_affine, scale_extent, expected_shape, expected_offset):
+        shape, offset = compute_shape_offset(spatial_shape, in_affine, out_affine, scale_extent)
+        np.testing.assert_array_equal(shape, expected_shape)
+        np.testing.assert_allclose(offset, expected_offset, rtol=1e-6, atol=1e-6)
+
+    def test_tensor_affine(self):
+        shape, offset = compute_shape_offset((4, 6), torch.diag(torch.tensor([-1.0, 1.0, 1.0])), torch.eye(3))
+        np.testing.assert_array_equal(shape, (4, 6))
+        np.testing.assert_allclose(offset, (-3.0, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,6 +24,7 @@ from monai.transforms import (
     create_shear,
     create_translate,
 )
+from monai.transforms.utils import scale_affine
 from tests.utils import assert_allclose, is_tf32_env
 
 
@@ -269,6 +270,23 @@ class TestCreateAffine(unittest.TestCase):
             np.array([[1.0, 0.0, 0.0, 1.0], [0.0, 1.0, 0.0, 2.0], [0.0, 0.0, 1.0, 3.0], [0.0, 0.0, 0.0, 1.0]]),
         )
 
+    def test_scale_affine(self):
+        np.testing.assert_allclose(
+            scale_affine((10, 20), (5, 40)), [[2.0, 0.0, 0.5], [0.0, 0.5, -0.25], [0.0, 0.0, 1.0]]
+        )
+        # mismatched ranks, the extra dimensions are not scaled
+        np.testing.assert_allclose(
+            scale_affine((10, 20, 30), (5, 40)),
+            [[2.0, 0.0, 0.0, 0.5], [0.0, 0.5, 0.0, -0.25], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]],
+        )
+        np.testing.assert_allclose(
+            scale_affine((10, 20), (5, 40, 60), centered=False),
+            [[2.0, 0.0, 0.0, 0.0], [0.0, 0.5, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]],
+        )
+        # the new size is clipped to at least 1
+        np.testing.assert_allclose(scale_affine((4, 6), (0, 3)), [[4.0, 0.0, 1.5], [0.0, 2.0, 0.5], [0.0, 0.0, 1.0]])
+        np.testing.assert_allclose(scale_affine((8, 8, 8), (8, 8, 8)), np.eye(4))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -17,7 +17,13 @@ import numpy as np
 import torch
 from parameterized import parameterized
 
-from monai.utils.type_conversion import get_equivalent_dtype, get_numpy_dtype_from_string, get_torch_dtype_from_string
+from monai.utils.type_conversion import (
+    dtype_numpy_to_torch,
+    dtype_torch_to_numpy,
+    get_equivalent_dtype,
+    get_numpy_dtype_from_string,
+    get_torch_dtype_from_string,
+)
 from tests.utils import TEST_NDARRAYS
 
 DTYPES = [torch.float32, np.float32, np.dtype(np.float32)]
@@ -60,6 +66,21 @@ class TestGetEquivalentDtype(unittest.TestCase):
         dtype = get_torch_dtype_from_string(dtype_str)
         self.assertEqual(dtype, expected_pt)
 
+    @parameterized.expand(
+        [
+            [torch.float32, np.float32],
+            [torch.float64, np.float64],
+            [torch.int64, np.int64],
+            [torch.uint8, np.uint8],
+            [torch.bool, np.bool_],
+        ]
+    )
+    def test_torch_numpy(self, dtype_pt, dtype_np):
+        for _ in range(2):  # the conversions are cached, the repeated calls should give the same results
+            self.assertEqual(dtype_torch_to_numpy(dtype_pt), np.dtype(dtype_np))
+            self.assertEqual(dtype_numpy_to_torch(np.dtype(dtype_np)), dtype_pt)
+            self.assertEqual(dtype_numpy_to_torch(dtype_np), dtype_pt)
+
 
 if __name__ == "__main__":
     unittest.main()
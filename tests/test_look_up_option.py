@@ -61,6 +61,12 @@ class TestLookUpOption(unittest.TestCase):
         self.assertEqual(str(_CaseStrEnum.MODE_A), "A")
         self.assertEqual(look_up_option("A", _CaseStrEnum), "A")
 
+    def test_str_enum_padded(self):
+        output = look_up_option("  B ", _CaseStrEnum)
+        self.assertIs(output, _CaseStrEnum.MODE_B)
+        output = look_up_option(" empty\n", _CaseEnum)
+        self.assertIs(output, _CaseEnum.EMPTY)
+
     def test_no_found(self):
         with self.assertRaisesRegex(ValueError, "Unsupported"):
             look_up_option("not here", {"a", "b"})
@@ -31,8 +31,9 @@ from monai.data import DataLoader, Dataset
 from monai.data.meta_obj import get_track_meta, set_track_meta
 from monai.data.meta_tensor import MetaTensor
 from monai.data.utils import decollate_batch, list_data_collate
-from monai.transforms import BorderPadd, Compose, DivisiblePadd, FromMetaTensord, ToMetaTensord
-from monai.utils.enums import PostFix
+from monai.transforms import BorderPadd, Compose, DivisiblePadd, Flip, FromMetaTensord, Rotate90, ToMetaTensord
+from monai.transforms.lazy.functional import apply_pending
+from monai.utils.enums import PostFix, TraceKeys
 from monai.utils.module import pytorch_after
 from tests.utils import TEST_DEVICES, SkipIfBeforePyTorchVersion, assert_allclose, skip_if_no_cuda
 
@@ -527,6 +528,26 @@ class TestMetaTensor(unittest.TestCase):
         self.assertIsInstance(m.peek_pending_affine(), torch.Tensor)
         self.assertTrue(m.peek_pending_rank() >= 1)
 
+    def test_apply_pending_ops(self):
+        m = MetaTensor(torch.rand(1, 10, 8))
+        m = Flip(spatial_axis=0, lazy=True)(m)
+        m = Rotate90(lazy=True)(m)
+        m = Flip(spatial_axis=1, lazy=True)(m)
+        pending = list(m.pending_operations)
+        out, applied = apply_pending(m)
+        self.assertEqual(out.pending_operations, [])
+        self.assertEqual(applied, pending)
+        self.assertEqual(out.applied_operations, pending)
+        names = [op[TraceKeys.CLASS_NAME] for op in out.applied_operations]
+        self.assertEqual(names, ["Flip", "Rotate90", "Flip"])
+
+        # the copied metatensor doesn't share the list of applied operations
+        copied = MetaTensor(out.as_tensor()).copy_meta_from(out)
+        self.assertIsNot(copied.applied_operations, out.applied_operations)
+        copied.extend_applied_operations([{}])
+        self.assertEqual(len(copied.applied_operations), 4)
+        self.assertEqual(len(out.applied_operations), 3)
+
     @parameterized.expand(TESTS)
     def test_multiprocessing(self, device=None, dtype=None):
         """multiprocessing sharing with 'device' and 'dtype'"""
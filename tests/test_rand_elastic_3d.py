@@ -18,7 +18,8 @@ import torch
 from parameterized import parameterized
 
 from monai.data import MetaTensor, set_track_meta
-from monai.transforms import Rand3DElastic
+from monai.networks.layers import GaussianFilter
+from monai.transforms import Rand3DElastic, create_grid
 from tests.utils import TEST_NDARRAYS_ALL, assert_allclose
 
 TESTS = []
@@ -99,6 +100,20 @@ class TestRand3DElastic(unittest.TestCase):
         result = g(**input_data)
         assert_allclose(result, expected_val, type_test=False, rtol=1e-1, atol=1e-1)
 
+    @parameterized.expand([[(1.0, 2.0), None], [(3.0, 5.0), [1, 1, 1]]])
+    def test_float64_reference(self, sigma_range, rotate_range):
+        img = torch.arange(120, dtype=torch.float).reshape((1, 4, 5, 6))
+        g = Rand3DElastic(sigma_range, (0.5, 2.0), prob=1.0, rotate_range=rotate_range, padding_mode="zeros")
+        g.set_random_state(123)
+        result = g(img)
+        # the reference deformation: float64 grid smoothed by a `GaussianFilter` module, with the same random state
+        grid = create_grid(spatial_size=img.shape[1:], backend="torch")
+        offset = torch.as_tensor(g.rand_offset).unsqueeze(0)
+        grid[:3] += GaussianFilter(3, g.sigma, 3.0)(offset)[0] * g.magnitude
+        grid = g.rand_affine_grid(grid=grid, randomize=False)
+        expected = g.resampler(img, grid, mode=g.mode, padding_mode=g.padding_mode)
+        assert_allclose(result, expected, type_test=False, rtol=1e-4, atol=1e-3)
+
 
 if __name__ == "__main__":
     unittest.main()
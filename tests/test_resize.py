@@ -57,6 +57,16 @@ class TestResize(NumpyImageTestCase2D):
             assert_allclose(im, result, type_test=False)
         set_track_meta(True)
 
+    def test_non_contiguous(self):
+        img = MetaTensor(torch.as_tensor(self.imt[0])).permute(0, 2, 1)
+        self.assertFalse(img.is_contiguous())
+        for spatial_size in ((32, 32), tuple(img.shape[1:])):
+            resize = Resize(spatial_size=spatial_size, mode="bilinear")
+            out = resize(img)
+            expected = resize(img.contiguous())
+            assert_allclose(out, expected, type_test=False)
+            assert_allclose(out.affine, expected.affine, type_test=False)
+
     @parameterized.expand(
         [
             ((32, -1), "area", True),
@@ -50,6 +50,19 @@ for p in TEST_NDARRAYS_ALL:
     TEST_CASES_SHAPE_3D.append((p, [np.pi / 4, 0, 0], "bilinear", "border", False))
     TEST_CASES_SHAPE_3D.append((p, [-np.pi / 4.5, -20, 20], "nearest", "reflection", False))
 
+# the bounding box of the rotated image, keep_size=False
+TEST_CASES_OUTPUT_SHAPE = [
+    ((10, 15), np.pi / 2, (15, 10)),
+    ((10, 15), -np.pi / 2, (15, 10)),
+    ((10, 15), np.pi, (10, 15)),
+    ((10, 15), np.pi / 4, (18, 18)),
+    ((10, 15), np.pi / 6, (16, 18)),
+    ((6, 10, 15), [np.pi / 2, 0, 0], (6, 15, 10)),
+    ((6, 10, 15), [np.pi / 4, 0, 0], (6, 18, 18)),
+    ((6, 10, 15), [0, np.pi / 2, np.pi / 2], (15, 6, 10)),
+    ((6, 10, 15), [np.pi / 4, np.pi / 4, 0], (15, 18, 18)),
+]
+
 
 class TestRotate2D(NumpyImageTestCase2D):
     @parameterized.expand(TEST_CASES_2D)
@@ -89,6 +102,16 @@ class TestRotate2D(NumpyImageTestCase2D):
         self.assertLessEqual(np.abs(good - expected.size), 5, "diff at most 5 pixels")
 
 
+class TestRotateOutputShape(unittest.TestCase):
+    @parameterized.expand(TEST_CASES_OUTPUT_SHAPE)
+    def test_output_shape(self, im_shape, angle, expected_shape):
+        im = torch.zeros((1, *im_shape))
+        rotated = Rotate(angle, keep_size=False)(im)
+        self.assertTupleEqual(tuple(rotated.shape[1:]), expected_shape)
+        rotated = Rotate(angle, keep_size=False, lazy=True)(im)
+        self.assertTupleEqual(tuple(rotated.peek_pending_shape()), expected_shape)
+
+
 class TestRotate3D(NumpyImageTestCase3D):
     @parameterized.expand(TEST_CASES_3D)
     def test_correct_results(self, im_type, angle, keep_size, mode, padding_mode, align_corners):
@@ -14,12 +14,13 @@ from __future__ import annotations
 import unittest
 
 import numpy as np
+import torch
 from parameterized import parameterized
 
 from monai.data import MetaTensor, set_track_meta
 from monai.transforms import Affine, Rotate90
 from monai.transforms.lazy.functional import apply_pending
-from monai.utils import optional_import
+from monai.utils import LazyAttr, optional_import
 from tests.lazy_transforms_utils import test_resampler_lazy
 from tests.utils import (
     TEST_NDARRAYS_ALL,
@@ -100,6 +101,24 @@ class TestRotate90(NumpyImageTestCase2D):
             expected = np.stack(expected)
             assert_allclose(rotated, p(expected), rtol=1.0e-5, atol=1.0e-8, type_test="tensor")
 
+    @parameterized.expand([[0], [4]])
+    def test_full_turns(self, k):
+        im = MetaTensor(torch.as_tensor(self.imt[0]))
+        rotate = Rotate90(k=k)
+        rotated = rotate(im)
+        assert_allclose(rotated, im, rtol=1.0e-5, atol=1.0e-8, type_test=False)
+        self.assertTrue(rotated.is_contiguous())
+        rotated.add_(1.0)  # the output is a copy of the input
+        assert_allclose(im, self.imt[0], rtol=1.0e-5, atol=1.0e-8, type_test=False)
+        test_local_inversion(rotate, rotated, im)
+
+        # the pending affine is exactly the identity
+        lazy_rotated = Rotate90(k=k, lazy=True)(im)
+        self.assertEqual(len(lazy_rotated.pending_operations), 1)
+        assert_allclose(lazy_rotated.pending_operations[-1][LazyAttr.AFFINE], np.eye(4), type_test=False, atol=0.0)
+        self.assertTupleEqual(tuple(lazy_rotated.peek_pending_shape()), tuple(im.shape[1:]))
+        assert_allclose(apply_pending(lazy_rotated)[0], im, rtol=1.0e-5, atol=1.0e-8, type_test=False)
+
 
 class TestRotate903d(NumpyImageTestCase3D):
     def test_rotate90_default(self):
@@ -12,6 +12,7 @@
 from __future__ import annotations
 
 import unittest
+from functools import reduce
 
 import numpy as np
 import torch
@@ -20,7 +21,9 @@ from parameterized import parameterized
 import monai.transforms as mt
 from monai.data import create_test_image_2d, create_test_image_3d
 from monai.data.meta_tensor import MetaTensor
+from monai.data.utils import to_affine_nd
 from monai.transforms.lazy.functional import apply_pending
+from monai.transforms.lazy.utils import Affine, DisplacementField, requires_interp
 from monai.transforms.transform import MapTransform
 from monai.utils import set_determinism
 from tests.lazy_transforms_utils import get_apply_param
@@ -181,5 +184,82 @@ class CombineLazyTest(unittest.TestCase):
                 self.assertGreater(match_ratio, 0.5)  # at least half of the images are very close
 
 
+class TestCombineAffines(unittest.TestCase):
+    def test_single(self):
+        a = np.array([[0.0, -1.0, 0.0, 2.0], [1.0, 0.0, 0.0, 3.0], [0.0, 0.0, 2.0, 4.0], [0.0, 0.0, 0.0, 1.0]])
+        for m in (a, torch.as_tensor(a, dtype=torch.float32)):
+            out = mt.combine_affines([m])
+            self.assertIsInstance(out, torch.Tensor)
+            self.assertEqual(out.dtype, torch.float64)
+            assert_allclose(out, a, type_test=False)
+
+    def test_promote_2d(self):
+        a = np.array([[0.0, -1.0, 2.0], [1.0, 0.0, 3.0], [0.0, 0.0, 1.0]])
+        expected = np.array([[0.0, -1.0, 0.0, 2.0], [1.0, 0.0, 0.0, 3.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]])
+        assert_allclose(mt.combine_affines([a]), expected, type_test=False)
+        assert_allclose(mt.combine_affines([torch.as_tensor(a), a]), expected @ expected, type_test=False)
+
+    def test_combine_mixed(self):
+        rng = np.random.RandomState(0)
+        matrices = []
+        for i in range(5):
+            m = np.eye(4) if i % 2 else np.eye(3)
+            m[:-1] = rng.rand(*m[:-1].shape)
+            matrices.append(m if i % 3 else torch.as_tensor(m, dtype=torch.float32))
+        out = mt.combine_affines(matrices)
+        self.assertTupleEqual(tuple(out.shape), (4, 4))
+        self.assertEqual(out.dtype, torch.float64)
+        pairwise = reduce(mt.combine_transforms, [to_affine_nd(3, torch.as_tensor(m).double()) for m in matrices])
+        assert_allclose(out, pairwise, type_test=False, rtol=1e-6, atol=1e-6)
+
+
+class TestAffineShaped(unittest.TestCase):
+    @parameterized.expand(
+        [
+            [np.eye(3), True],
+            [torch.eye(4), True],
+            [torch.zeros((2, 4, 4)), True],
+            [Affine(np.zeros((1, 1))), True],
+            [np.zeros((2, 2)), False],
+            [np.zeros((5, 5)), False],
+            [np.zeros((3, 4)), False],
+            [np.zeros(4), False],
+            [[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]], False],  # no shape attribute
+            [DisplacementField(np.eye(4)), False],
+        ]
+    )
+    def test_is_affine_shaped(self, data, expected):
+        self.assertIs(Affine.is_affine_shaped(data), expected)
+
+
+_nan = float("nan")
+
+TEST_REQUIRES_INTERP = [
+    [[[1, 0, 0], [0, 1, 0], [0, 0, 1]], 1e-3, [0, 1, 2]],
+    [[[0, -1, 3], [1, 0, 0], [0, 0, 1]], 1e-3, [0, 2, 1]],
+    [[[0, 0, 1, 0], [0, -1, 0, 2], [1, 0, 0, 0], [0, 0, 0, 1]], 1e-3, [0, 3, 2, 1]],
+    [[[_nan, 0, 0], [0, 1, 0], [0, 0, 1]], 1e-3, None],
+    [[[1, 0, _nan], [0, 1, 0], [0, 0, 1]], 1e-3, None],
+    [[[float("inf"), 0, 0], [0, 1, 0], [0, 0, 1]], 1e-3, None],
+    # +/-1 entries are compared with `atol` plus the default `rtol` of `np.isclose`
+    [[[1.001005, 0, 0], [0, -0.998995, 0], [0, 0, 1]], 1e-3, [0, 1, 2]],
+    [[[1.00102, 0, 0], [0, 1, 0], [0, 0, 1]], 1e-3, None],
+    [[[1.00102, 0, 0], [0, 1, 0], [0, 0, 1]], 1e-1, [0, 1, 2]],
+    # zero entries are compared with `atol` only
+    [[[1, 0.000999, 0], [-0.000999, 1, 0], [0, 0, 1]], 1e-3, [0, 1, 2]],
+    [[[1, 0.001001, 0], [0, 1, 0], [0, 0, 1]], 1e-3, None],
+    [[[1, 1, 0], [0, 0, 0], [0, 0, 1]], 1e-3, None],
+    [[[1, 0, 0.5], [0, 1, 0], [0, 0, 1]], 1e-3, None],
+    [[[0.7071, -0.7071, 0], [0.7071, 0.7071, 0], [0, 0, 1]], 1e-3, None],
+]
+
+
+class TestRequiresInterp(unittest.TestCase):
+    @parameterized.expand(TEST_REQUIRES_INTERP)
+    def test_requires_interp(self, matrix, atol, expected):
+        for m in (np.asarray(matrix, dtype=float), torch.as_tensor(matrix, dtype=torch.float64)):
+            self.assertEqual(requires_interp(m, atol=atol), expected)
+
+
 if __name__ == "__main__":
     unittest.main()
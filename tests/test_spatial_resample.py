@@ -230,6 +230,18 @@ class TestSpatialResample(unittest.TestCase):
             assert_allclose(result, img, type_test=False)
         set_track_meta(True)
 
+    @parameterized.expand(TEST_DEVICES)
+    def test_non_contiguous(self, device):
+        img = MetaTensor(torch.arange(12.0).reshape(1, 4, 3), affine=torch.eye(4)).to(device).permute(0, 2, 1)
+        self.assertFalse(img.is_contiguous())
+        dst = torch.tensor([[-1.0, 0.0, 0.0, 2.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]])
+        for dst_affine in (None, dst):
+            out = SpatialResample()(img, dst_affine=dst_affine)
+            expected = SpatialResample()(img.contiguous(), dst_affine=dst_affine)
+            assert_allclose(out, expected, type_test=False)
+            assert_allclose(out.affine, expected.affine, type_test=False)
+        self.assertFalse(img.is_contiguous())
+
 
 if __name__ == "__main__":
     unittest.main()
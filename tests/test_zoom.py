@@ -37,9 +37,21 @@ VALID_CASES = [
     (0.8, "area"),
     (1.5, "nearest", False, True),
     (0.8, "area", False, True),
+    (1.0, "nearest"),
+    (1.0, "bilinear", True),
+    (1.0, "bilinear", False, True),
+    (1.0, "area", True, True),
 ]
 
-INVALID_CASES = [((None, None), "bilinear", TypeError), ((0.9, 0.9), "s", ValueError)]
+# the zoomed size is floored to the input size, (1, 5, 7) * 1.05 -> (1, 5, 7)
+UNCHANGED_SIZE_CASES = [
+    (1.05, "bilinear", False, False),
+    (1.05, "bilinear", True, False),
+    (1.05, "bilinear", True, True),
+    (1.0, "area", None, True),
+]
+
+INVALID_CASES = [((None, None), "bilinear", TypeError), ((0.9, 0.9), "s", ValueError), (1.0, "s", ValueError)]
 
 
 class TestZoom(NumpyImageTestCase2D):
@@ -80,6 +92,29 @@ class TestZoom(NumpyImageTestCase2D):
             expected = np.stack(expected).astype(np.float32)
             assert_allclose(zoomed, p(expected), atol=1.0, type_test=False)
 
+    @parameterized.expand(UNCHANGED_SIZE_CASES)
+    def test_unchanged_size(self, zoom, mode, align_corners, keep_size):
+        im = MetaTensor(torch.arange(35, dtype=torch.float32).reshape(1, 5, 7))
+        zoom_fn = Zoom(zoom=zoom, mode=mode, keep_size=keep_size, align_corners=align_corners)
+        zoomed = zoom_fn(im)
+        assert_allclose(zoomed, im, type_test=False)
+        assert_allclose(zoomed.affine, im.affine, type_test=False)
+        zoomed.add_(1.0)  # the output is a copy of the input
+        assert_allclose(im, torch.arange(35).reshape(1, 5, 7), type_test=False)
+        test_local_inversion(zoom_fn, zoomed, im)
+
+        zoom_fn.lazy = True
+        pending_result = zoom_fn(im)
+        assert_allclose(pending_result.peek_pending_shape(), im.shape[1:], type_test=False)
+        assert_allclose(apply_pending(pending_result)[0], im, type_test=False)
+
+    def test_unchanged_size_invalid_align_corners(self):
+        im = MetaTensor(torch.arange(35, dtype=torch.float32).reshape(1, 5, 7))
+        for zoom in (1.05, 1.5):  # the same error whether or not the size changes
+            zoom_fn = Zoom(zoom=zoom, mode="nearest", align_corners=False, keep_size=True)
+            with self.assertRaisesRegex(ValueError, "align_corners"):
+                zoom_fn(im)
+
     def test_keep_size(self):
         for p in TEST_NDARRAYS_ALL:
             zoom_fn = Zoom(zoom=[0.6, 0.6], keep_size=True, align_corners=True)